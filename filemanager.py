@@ -5,31 +5,201 @@ for advanced file management and system utilities.
 """
 
 import click
+# Text and Style are loaded by rich.console anyway; the other rich
+# components (rich.syntax pulls in pygments) are imported by the commands
+# that use them, so that e.g. `fm list` starts quickly
 from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.prompt import Prompt, Confirm
-from rich.syntax import Syntax
 from rich.text import Text
+from rich.style import Style
 from pathlib import Path
 import os
 import shutil
-import json
-import hashlib
+import io
+import errno
 import mimetypes
 from datetime import datetime
 import stat
-import subprocess
+import time
 import sys
-from typing import List, Dict, Optional
-import zipfile
-import tarfile
+from typing import TYPE_CHECKING, List, Dict, Iterator, Optional, Tuple
+from collections import Counter, deque
+from itertools import chain, islice
+from array import array
+import heapq
+from operator import attrgetter
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    import zipfile
 
 # Initialize Rich console
 console = Console()
 
+# Units used by FileManager.format_size, one per power of 1024
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Number of entries shown in the analyze "Largest Files" table
+LARGEST_FILES_LIMIT = 10
+
+# Buffer size for chunked reads (hashing without file_digest, line counting)
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Files larger than this share of MemAvailable get page cache hints when hashed
+CACHE_HINT_MEMORY_FRACTION = 0.25
+
+# Files modified more recently than this are never hashed through mmap
+MMAP_SETTLED_SECONDS = 60
+
+# Buffer size for userspace copies (copy fallback, tar extraction)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Style applied to directory names in the detailed listing
+DIR_NAME_STYLE = Style(bold=True)
+
+# File suffix -> icon used by list and tree
+FILE_ICONS: Dict[str, str] = {sys.intern(suffix): icon for suffix, icon in {
+    '.py': '🐍', '.js': '🟨', '.html': '🌐', '.css': '🎨',
+    '.json': '📋', '.xml': '📄', '.txt': '📝', '.md': '📖',
+    '.jpg': '🖼️', '.png': '🖼️', '.gif': '🖼️', '.svg': '🖼️',
+    '.mp4': '🎬', '.mp3': '🎵', '.wav': '🎵', '.avi': '🎬',
+    '.pdf': '📕', '.doc': '📘', '.docx': '📘', '.xls': '📗',
+    '.zip': '📦', '.rar': '📦', '.7z': '📦', '.tar': '📦',
+    '.exe': '⚙️', '.msi': '⚙️', '.deb': '⚙️', '.rpm': '⚙️'
+}.items()}
+
+# list_directory sort field -> (key function, reverse)
+SORT_KEYS = {
+    'size': (attrgetter('size'), True),
+    'modified': (attrgetter('mtime'), True),
+    'type': (attrgetter('is_file', 'suffix'), False),
+    'name': (lambda x: (x.is_file, x.name.lower()), False),
+}
+
+# Zip members up to this size are deflated in memory on a worker thread
+PARALLEL_DEFLATE_LIMIT = 8 * 1024 * 1024
+
+# Most member data queued for (or held by) the zip deflate workers at once
+PARALLEL_DEFLATE_BUDGET = 64 * 1024 * 1024
+
+# copy_file_range errors that mean "not supported here", not a failed copy
+COPY_FALLBACK_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ETXTBSY}
+
+def _file_suffix(name: str) -> str:
+    """Lowercased extension of a file name, as os.path.splitext splits it:
+    leading dots (".bashrc", "..foo") do not start an extension"""
+    dot = name.rfind('.')
+    return name[dot:].lower() if dot > 0 and name[:dot].lstrip('.') else ''
+
+class FileRow:
+    """Detailed information about a single file or directory"""
+    
+    __slots__ = ('name', 'path', 'size', 'mtime', 'ctime', 'mode',
+                 'is_dir', 'is_file', 'suffix')
+    
+    def __init__(self, name: str, path: str, stat_info: os.stat_result):
+        mode = stat_info.st_mode
+        self.name = name
+        self.path = path
+        self.size = stat_info.st_size
+        # Raw timestamps; datetimes are only built for rows that are shown
+        self.mtime = stat_info.st_mtime
+        self.ctime = stat_info.st_ctime
+        self.mode = mode
+        self.is_dir = stat.S_ISDIR(mode)
+        self.is_file = stat.S_ISREG(mode)
+        # Split the extension off once, for sorting, icons and MIME types
+        self.suffix = _file_suffix(name)
+    
+    @property
+    def modified(self) -> datetime:
+        return datetime.fromtimestamp(self.mtime)
+    
+    @property
+    def created(self) -> datetime:
+        return datetime.fromtimestamp(self.ctime)
+    
+    @property
+    def permissions(self) -> str:
+        return stat.filemode(self.mode)
+    
+    @property
+    def mime_type(self) -> str:
+        # Direct lookup on the already lowercased suffix, skipping guess_type
+        if not mimetypes.inited:
+            mimetypes.init()
+        return mimetypes.types_map.get(self.suffix, 'unknown')
+
+@lru_cache(maxsize=None)
+def _import_zipfile():
+    """Import zipfile, routing its deflate through zlib-ng when installed.
+    
+    Cached: a failed zlib_ng import is not remembered by Python, and this
+    is looked up for every zip member.
+    """
+    import zipfile
+    try:
+        # Optional SIMD-accelerated deflate (pip install zlib-ng)
+        from zlib_ng import zlib_ng
+    except ImportError:
+        pass
+    else:
+        # zlib_ng is a drop-in zlib replacement, so zipfile can use it directly
+        zipfile.zlib = zlib_ng
+    return zipfile
+
+class _PassThroughCompressor:
+    """Compressor stand-in for zip members deflated ahead of time"""
+    
+    def compress(self, data) -> bytes:
+        return data
+    
+    def flush(self) -> bytes:
+        return b''
+
+# Private _ZipWriteFile fields that _write_precompressed relies on
+_ZIP_WRITER_FIELDS = ('_compressor', '_crc', '_file_size')
+
+def _deflate_bytes(data: bytes) -> Tuple[bytes, int, int]:
+    """Raw-deflate data the way zipfile does, returning (data, crc, size)"""
+    # zipfile.zlib may be zlib-ng, see _import_zipfile
+    zlib = _import_zipfile().zlib
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush(), zlib.crc32(data), len(data)
+
+def _write_precompressed(zf: 'zipfile.ZipFile', zinfo: 'zipfile.ZipInfo',
+                         compressed: bytes, crc: int, size: int) -> bool:
+    """Write already deflated data as a zip member.
+    
+    zipfile has no public API for this: the member writer gets a
+    pass-through compressor and is told the real CRC and size. Returns
+    False, leaving an empty member, if the writer lacks those fields.
+    """
+    zinfo.compress_type = _import_zipfile().ZIP_DEFLATED
+    with zf.open(zinfo, 'w') as dest:
+        if not all(hasattr(dest, field) for field in _ZIP_WRITER_FIELDS):
+            return False
+        dest._compressor = _PassThroughCompressor()
+        dest.write(compressed)
+        dest._crc = crc
+        dest._file_size = size
+    return True
+
+@lru_cache(maxsize=None)
+def _precompressed_zip_supported() -> bool:
+    """Round-trip a pre-deflated member through an in-memory archive once,
+    so a zipfile change disables the parallel path instead of corrupting output"""
+    zipfile = _import_zipfile()
+    data = b'advanced file manager zip round-trip check\n' * 64
+    buffer = io.BytesIO()
+    try:
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+            if not _write_precompressed(zf, zipfile.ZipInfo('check.txt'), *_deflate_bytes(data)):
+                return False
+        with zipfile.ZipFile(buffer) as zf:
+            return zf.testzip() is None and zf.read('check.txt') == data
+    except Exception:
+        return False
+
 class FileManager:
     """Advanced file management operations with rich output"""
     
@@ -39,113 +209,318 @@ class FileManager:
     
     def format_size(self, size_bytes: int) -> str:
         """Convert bytes to human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024:
-                return f"{size_bytes:.1f}{unit}"
-            size_bytes /= 1024
-        return f"{size_bytes:.1f}PB"
+        if size_bytes < 1024:
+            return f"{size_bytes:.1f}B"
+        # Integer log1024 picks the unit without a division loop
+        index = min((size_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (index * 10)):.1f}{SIZE_UNITS[index]}"
     
-    def get_file_info(self, path: Path) -> Dict:
+    def get_file_info(self, path: Path) -> Optional[FileRow]:
         """Get detailed file information"""
         try:
-            stat_info = path.stat()
-            return {
-                'name': path.name,
-                'path': str(path),
-                'size': stat_info.st_size,
-                'size_formatted': self.format_size(stat_info.st_size),
-                'modified': datetime.fromtimestamp(stat_info.st_mtime),
-                'created': datetime.fromtimestamp(stat_info.st_ctime),
-                'permissions': stat.filemode(stat_info.st_mode),
-                'is_dir': path.is_dir(),
-                'is_file': path.is_file(),
-                'suffix': path.suffix.lower(),
-                'mime_type': mimetypes.guess_type(str(path))[0] or 'unknown'
-            }
-        except (OSError, PermissionError) as e:
-            return {'error': str(e), 'name': path.name}
+            return FileRow(path.name, str(path), path.stat())
+        except (OSError, PermissionError):
+            return None
+    
+    def _info_from_entry(self, entry: os.DirEntry) -> Optional[FileRow]:
+        """Get file information from a scandir entry, reusing its cached stat"""
+        try:
+            return FileRow(entry.name, entry.path, entry.stat())
+        except (OSError, PermissionError):
+            return None
     
     def calculate_hash(self, file_path: Path, algorithm: str = 'md5') -> str:
         """Calculate file hash"""
-        hash_func = getattr(hashlib, algorithm.lower())()
+        import hashlib
+        import mmap
+        
+        algorithm = algorithm.lower()
         
         try:
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_func.update(chunk)
+            with open(file_path, 'rb', buffering=0) as f:
+                # For files large next to free memory, ask for aggressive readahead
+                # and drop the pages once hashed so they don't push hotter data out
+                # of the page cache; smaller files are left cached for the next read
+                available = self._available_memory()
+                hint = (available > 0 and
+                        os.fstat(f.fileno()).st_size > available * CACHE_HINT_MEMORY_FRACTION)
+                if hint:
+                    self._advise(f.fileno(), 'POSIX_FADV_SEQUENTIAL', 'POSIX_FADV_WILLNEED')
+                try:
+                    if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                        hash_func = hashlib.file_digest(f, algorithm)
+                    elif self._can_mmap(f.fileno()):
+                        # Hash the mapped file in a single update() call
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                                mm.madvise(mmap.MADV_SEQUENTIAL)
+                            hash_func = getattr(hashlib, algorithm)()
+                            hash_func.update(mm)
+                    else:
+                        hash_func = getattr(hashlib, algorithm)()
+                        buffer = memoryview(bytearray(READ_CHUNK_SIZE))
+                        while True:
+                            size = f.readinto(buffer)
+                            if not size:
+                                break
+                            hash_func.update(buffer[:size])
+                finally:
+                    if hint:
+                        self._advise(f.fileno(), 'POSIX_FADV_DONTNEED')
             return hash_func.hexdigest()
         except Exception as e:
             return f"Error: {e}"
     
+    def count_lines(self, file_path: Path) -> int:
+        """Count lines in a file without decoding or holding it in memory.
+        
+        Matches text mode's universal newlines: \n, \r\n and a lone \r
+        each end a line.
+        """
+        line_ends = 0
+        last_byte = b'\n'
+        buffer = bytearray(READ_CHUNK_SIZE)
+        with open(file_path, 'rb', buffering=0) as f:
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                line_ends += (buffer.count(b'\n', 0, size) + buffer.count(b'\r', 0, size)
+                              - buffer.count(b'\r\n', 0, size))
+                # A \r\n split across two reads was counted twice
+                if last_byte == b'\r' and buffer[0] == 0x0A:
+                    line_ends -= 1
+                last_byte = buffer[size - 1:size]
+        # A final line without a line ending still counts
+        return line_ends + (last_byte not in (b'\n', b'\r'))
+    
+    def _can_mmap(self, fd: int) -> bool:
+        """Whether a file is safe and worthwhile to hash through mmap.
+        
+        Truncating a mapped file turns reads into SIGBUS, which kills the
+        whole process, so only files that look settled are mapped: not
+        modified for MMAP_SETTLED_SECONDS and unchanged across two fstats.
+        """
+        before = os.fstat(fd)
+        if not 0 < before.st_size <= self._available_memory() // 2:
+            return False
+        if time.time() - before.st_mtime < MMAP_SETTLED_SECONDS:
+            return False
+        after = os.fstat(fd)
+        return (after.st_size, after.st_mtime_ns) == (before.st_size, before.st_mtime_ns)
+    
+    def _available_memory(self) -> int:
+        """MemAvailable in bytes (free plus reclaimable), or 0 if unknown"""
+        try:
+            with open('/proc/meminfo') as f:
+                for line in f:
+                    if line.startswith('MemAvailable:'):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError, IndexError):
+            pass
+        return 0
+    
+    def _advise(self, fd: int, *advice: str):
+        """Pass page cache hints for a whole file, where posix_fadvise exists"""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        for name in advice:
+            try:
+                os.posix_fadvise(fd, 0, 0, getattr(os, name))
+            except OSError:
+                pass
+    
+    def release_file_cache(self, path):
+        """Hint that a file's cached pages won't be needed again soon"""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            self._advise(fd, 'POSIX_FADV_DONTNEED')
+        finally:
+            os.close(fd)
+    
+    def copy_file(self, source: Path, destination: Path) -> Path:
+        """Copy a file with its metadata, keeping the data in the kernel where possible"""
+        if destination.is_dir():
+            destination = destination / source.name
+        if destination.exists() and os.path.samefile(source, destination):
+            raise shutil.SameFileError(f"'{source}' and '{destination}' are the same file")
+        
+        with open(source, 'rb') as src, open(destination, 'wb') as dst:
+            copied = False
+            if hasattr(os, 'copy_file_range'):  # Linux 4.5+
+                try:
+                    total = 0
+                    while True:
+                        sent = os.copy_file_range(src.fileno(), dst.fileno(), 1 << 30)
+                        if not sent:
+                            break
+                        total += sent
+                    # As in shutil, nothing copied means "try read/write": some
+                    # files (e.g. under /proc) report no data to copy_file_range
+                    copied = total > 0
+                except OSError as e:
+                    if e.errno not in COPY_FALLBACK_ERRNOS:
+                        raise
+            
+            if not copied:
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+                shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+        
+        shutil.copystat(source, destination)
+        return destination
+    
+    def write_zip_members(self, zf: 'zipfile.ZipFile', members: List[Tuple[Path, str]]):
+        """Add (path, arcname) files to a ZIP_DEFLATED archive in order.
+        
+        Small files are deflated on a thread pool (zlib releases the GIL)
+        while earlier members are written; larger ones go through zf.write
+        so they are never held in memory.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        zipfile = _import_zipfile()
+        precompress = _precompressed_zip_supported()
+        workers = os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            queued_bytes = 0
+            for path, arcname in members:
+                zinfo = zipfile.ZipInfo.from_file(path, arcname)
+                if precompress and zinfo.file_size <= PARALLEL_DEFLATE_LIMIT:
+                    # Bound the file data waiting in memory, not the member count
+                    while pending and queued_bytes + zinfo.file_size > PARALLEL_DEFLATE_BUDGET:
+                        queued_bytes -= self._write_zip_member(zf, *pending.popleft())
+                    future = executor.submit(self._deflate_file, path)
+                    queued = zinfo.file_size
+                else:
+                    future = None
+                    queued = 0
+                queued_bytes += queued
+                pending.append((path, zinfo, future, queued))
+            
+            while pending:
+                self._write_zip_member(zf, *pending.popleft())
+    
+    def _deflate_file(self, path: Path) -> Tuple[bytes, int, int]:
+        """Read and raw-deflate a file, returning (data, crc, size)"""
+        with open(path, 'rb') as f:
+            return _deflate_bytes(f.read())
+    
+    def _write_zip_member(self, zf: 'zipfile.ZipFile', path: Path,
+                          zinfo: 'zipfile.ZipInfo', future, queued: int) -> int:
+        """Write one member, either pre-deflated by a worker or via zf.write.
+        Returns queued, the bytes it held against PARALLEL_DEFLATE_BUDGET"""
+        if future is None:
+            zf.write(path, zinfo.filename)
+        else:
+            _write_precompressed(zf, zinfo, *future.result())
+        return queued
+    
     def list_directory(self, path: Path, show_hidden: bool = False, 
-                      sort_by: str = 'name') -> List[Dict]:
+                      sort_by: str = 'name') -> List[FileRow]:
         """List directory contents with detailed information"""
         try:
             items = []
-            for item in path.iterdir():
-                if not show_hidden and item.name.startswith('.'):
-                    continue
-                
-                info = self.get_file_info(item)
-                if 'error' not in info:
-                    items.append(info)
+            with os.scandir(path) as it:
+                for entry in it:
+                    # Skip hidden entries before paying for their stat call
+                    if entry.name[:1] == '.' and not show_hidden:
+                        continue
+                    
+                    info = self._info_from_entry(entry)
+                    if info is not None:
+                        items.append(info)
             
             # Sort items
-            if sort_by == 'size':
-                items.sort(key=lambda x: x['size'], reverse=True)
-            elif sort_by == 'modified':
-                items.sort(key=lambda x: x['modified'], reverse=True)
-            elif sort_by == 'type':
-                items.sort(key=lambda x: (x['is_file'], x['suffix']))
-            else:  # name
-                items.sort(key=lambda x: (x['is_file'], x['name'].lower()))
+            key, reverse = SORT_KEYS.get(sort_by, SORT_KEYS['name'])
+            items.sort(key=key, reverse=reverse)
             
             return items
         except PermissionError:
             console.print(f"[red]Permission denied: {path}[/red]")
             return []
     
+    def scan_directory(self, path: str, show_hidden: bool = True
+                       ) -> Tuple[List[str], List[str], array]:
+        """Scan one directory level, returning its subdirectories plus
+        the paths and sizes of its files as parallel columns"""
+        dirs = []
+        file_paths = []
+        file_sizes = array('q')
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name[:1] == '.' and not show_hidden:
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            file_sizes.append(entry.stat(follow_symlinks=False).st_size)
+                            file_paths.append(entry.path)
+                    except OSError:
+                        continue
+        except (OSError, PermissionError):
+            pass
+        return dirs, file_paths, file_sizes
+    
+    def scan_tree(self, root: Path, show_hidden: bool = True
+                  ) -> Iterator[Tuple[List[str], List[str], array]]:
+        """Scan every directory below root, without following symlinks,
+        yielding each directory's scan_directory result in turn.
+        Hidden directories are not descended into unless show_hidden is set.
+        """
+        pending = deque([str(root)])
+        while pending:
+            result = self.scan_directory(pending.pop(), show_hidden)
+            pending.extend(result[0])
+            yield result
+    
     def display_directory_tree(self, path: Path, max_depth: int = 3, 
                               show_hidden: bool = False):
         """Display directory structure as a tree"""
-        def add_tree_items(tree_node, current_path: Path, current_depth: int):
+        from rich.tree import Tree
+        
+        def add_tree_items(tree_node, current_path: str, current_depth: int):
             if current_depth >= max_depth:
                 return
             
             try:
-                items = sorted(current_path.iterdir(), 
-                             key=lambda x: (x.is_file(), x.name.lower()))
+                # Drop hidden entries while reading so they are never sorted;
+                # is_dir() is answered from d_type, only symlinks need a stat
+                with os.scandir(current_path) as it:
+                    items = sorted(
+                        (e for e in it if show_hidden or e.name[:1] != '.'),
+                        key=lambda e: (not e.is_dir(), e.name.lower())
+                    )
                 
-                for item in items:
-                    if not show_hidden and item.name.startswith('.'):
-                        continue
-                    
-                    if item.is_dir():
-                        branch = tree_node.add(f"📁 [bold blue]{item.name}[/bold blue]")
-                        add_tree_items(branch, item, current_depth + 1)
+                for entry in items:
+                    if entry.is_dir() and entry.is_symlink():
+                        # Linked directories are shown but never expanded
+                        tree_node.add(f"🔗 [bold blue]{entry.name}[/bold blue]")
+                    elif entry.is_dir():
+                        branch = tree_node.add(f"📁 [bold blue]{entry.name}[/bold blue]")
+                        add_tree_items(branch, entry.path, current_depth + 1)
                     else:
-                        icon = self.get_file_icon(item.suffix)
-                        tree_node.add(f"{icon} {item.name}")
+                        icon = self.get_file_icon(_file_suffix(entry.name))
+                        tree_node.add(f"{icon} {entry.name}")
                         
             except PermissionError:
                 tree_node.add("[red]Permission denied[/red]")
         
         tree = Tree(f"📁 [bold blue]{path.name or path}[/bold blue]")
-        add_tree_items(tree, path, 0)
+        add_tree_items(tree, str(path), 0)
         console.print(tree)
     
-    def get_file_icon(self, suffix: str) -> str:
-        """Get icon for file type"""
-        icons = {
-            '.py': '🐍', '.js': '🟨', '.html': '🌐', '.css': '🎨',
-            '.json': '📋', '.xml': '📄', '.txt': '📝', '.md': '📖',
-            '.jpg': '🖼️', '.png': '🖼️', '.gif': '🖼️', '.svg': '🖼️',
-            '.mp4': '🎬', '.mp3': '🎵', '.wav': '🎵', '.avi': '🎬',
-            '.pdf': '📕', '.doc': '📘', '.docx': '📘', '.xls': '📗',
-            '.zip': '📦', '.rar': '📦', '.7z': '📦', '.tar': '📦',
-            '.exe': '⚙️', '.msi': '⚙️', '.deb': '⚙️', '.rpm': '⚙️'
-        }
-        return icons.get(suffix.lower(), '📄')
+    @staticmethod
+    def get_file_icon(suffix: str) -> str:
+        """Get icon for a lowercased file suffix"""
+        return FILE_ICONS.get(suffix, '📄')
 
 @click.group()
 @click.version_option(version='1.0.0')
@@ -169,6 +544,8 @@ def cli(ctx):
 @click.pass_context
 def list(ctx, path: str, hidden: bool, sort: str, details: bool):
     """📂 List directory contents with rich formatting"""
+    from rich.table import Table
+    
     file_manager = ctx.obj['file_manager']
     target_path = Path(path).resolve()
     
@@ -197,13 +574,20 @@ def list(ctx, path: str, hidden: bool, sort: str, details: bool):
         table.add_column("Modified", style="blue")
         table.add_column("Permissions", style="yellow")
         
-        for item in items:
-            icon = "📁" if item['is_dir'] else file_manager.get_file_icon(item['suffix'])
-            name = f"[bold]{item['name']}[/bold]" if item['is_dir'] else item['name']
-            size = "-" if item['is_dir'] else item['size_formatted']
-            modified = item['modified'].strftime("%Y-%m-%d %H:%M")
-            
-            table.add_row(icon, name, size, modified, item['permissions'])
+        # Build every cell as Text up front so Rich never has to run its
+        # markup parser over the rows (this also keeps names like "[x]" literal)
+        rows = [
+            (
+                Text("📁" if item.is_dir else file_manager.get_file_icon(item.suffix)),
+                Text(item.name, style=DIR_NAME_STYLE if item.is_dir else ""),
+                Text("-" if item.is_dir else file_manager.format_size(item.size)),
+                Text(item.modified.strftime("%Y-%m-%d %H:%M")),
+                Text(item.permissions),
+            )
+            for item in items
+        ]
+        for row in rows:
+            table.add_row(*row)
         
         console.print(table)
     else:
@@ -214,17 +598,17 @@ def list(ctx, path: str, hidden: bool, sort: str, details: bool):
             row = []
             
             for item in row_items:
-                icon = "📁" if item['is_dir'] else file_manager.get_file_icon(item['suffix'])
-                style = "bold cyan" if item['is_dir'] else "white"
-                row.append(f"{icon} [{style}]{item['name']}[/{style}]")
+                icon = "📁" if item.is_dir else file_manager.get_file_icon(item.suffix)
+                style = "bold cyan" if item.is_dir else "white"
+                row.append(f"{icon} [{style}]{item.name}[/{style}]")
             
             console.print("  ".join(f"{item:<30}" for item in row))
     
     # Show summary
     total_items = len(items)
-    total_dirs = sum(1 for item in items if item['is_dir'])
+    total_dirs = sum(1 for item in items if item.is_dir)
     total_files = total_items - total_dirs
-    total_size = sum(item['size'] for item in items if not item['is_dir'])
+    total_size = sum(item.size for item in items if not item.is_dir)
     
     console.print(f"\n[dim]📊 Summary: {total_dirs} directories, "
                  f"{total_files} files, {file_manager.format_size(total_size)} total[/dim]")
@@ -251,45 +635,90 @@ def tree(ctx, path: str, depth: int, hidden: bool):
     file_manager.display_directory_tree(target_path, depth, hidden)
 
 @cli.command()
-@click.argument('file_path')
+@click.argument('file_paths', nargs=-1)
 @click.option('--algorithm', '-a', default='md5', 
               type=click.Choice(['md5', 'sha1', 'sha256', 'sha512']),
               help='Hash algorithm to use')
 @click.pass_context
-def hash(ctx, file_path: str, algorithm: str):
-    """🔐 Calculate file hash"""
+def hash(ctx, file_paths: tuple, algorithm: str):
+    """🔐 Calculate file hashes"""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+    from rich.table import Table
+    
     file_manager = ctx.obj['file_manager']
-    target_path = Path(file_path)
     
-    if not target_path.exists():
-        console.print(f"[red]Error: File '{file_path}' does not exist[/red]")
+    if not file_paths:
+        console.print("[red]Error: No files specified[/red]")
         return
     
-    if not target_path.is_file():
-        console.print(f"[red]Error: '{file_path}' is not a file[/red]")
+    targets = []
+    for file_path in file_paths:
+        target_path = Path(file_path)
+        
+        if not target_path.exists():
+            console.print(f"[red]Error: File '{file_path}' does not exist[/red]")
+            continue
+        
+        if not target_path.is_file():
+            console.print(f"[red]Error: '{file_path}' is not a file[/red]")
+            continue
+        
+        targets.append(target_path)
+    
+    if not targets:
         return
     
     console.print(f"\n[bold cyan]🔐 Calculating {algorithm.upper()} hash...[/bold cyan]")
     
+    # Hashing releases the GIL, so files are processed on a thread pool
+    hashes = {}
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
         console=console
     ) as progress:
-        task = progress.add_task("Hashing file...", total=None)
-        hash_value = file_manager.calculate_hash(target_path, algorithm)
+        task = progress.add_task("Hashing files...", total=len(targets))
+        max_workers = min(len(targets), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(file_manager.calculate_hash, target_path, algorithm): target_path
+                for target_path in targets
+            }
+            for future in as_completed(futures):
+                hashes[futures[future]] = future.result()
+                progress.advance(task)
     
-    file_info = file_manager.get_file_info(target_path)
+    if len(targets) == 1:
+        target_path = targets[0]
+        file_info = file_manager.get_file_info(target_path)
+        size = file_manager.format_size(file_info.size) if file_info else "-"
+        
+        panel = Panel(
+            f"[bold white]File:[/bold white] {target_path.name}\n"
+            f"[bold white]Size:[/bold white] {size}\n"
+            f"[bold white]{algorithm.upper()}:[/bold white] [green]{hashes[target_path]}[/green]",
+            title=f"🔐 File Hash ({algorithm.upper()})",
+            border_style="green"
+        )
+        
+        console.print(panel)
+        return
+    
+    table = Table(title=f"🔐 File Hashes ({algorithm.upper()})", show_header=True)
+    table.add_column("File", style="cyan")
+    table.add_column("Size", style="white", justify="right")
+    table.add_column(algorithm.upper(), style="green")
     
-    panel = Panel(
-        f"[bold white]File:[/bold white] {target_path.name}\n"
-        f"[bold white]Size:[/bold white] {file_info['size_formatted']}\n"
-        f"[bold white]{algorithm.upper()}:[/bold white] [green]{hash_value}[/green]",
-        title=f"🔐 File Hash ({algorithm.upper()})",
-        border_style="green"
-    )
+    for target_path in targets:
+        file_info = file_manager.get_file_info(target_path)
+        size = file_manager.format_size(file_info.size) if file_info else "-"
+        table.add_row(str(target_path), size, hashes[target_path])
     
-    console.print(panel)
+    console.print(table)
 
 @cli.command()
 @click.argument('source')
@@ -299,6 +728,9 @@ def hash(ctx, file_path: str, algorithm: str):
 @click.pass_context
 def copy(ctx, source: str, destination: str, recursive: bool, force: bool):
     """📋 Copy files or directories"""
+    from rich.prompt import Confirm
+    
+    file_manager = ctx.obj['file_manager']
     source_path = Path(source)
     dest_path = Path(destination)
     
@@ -314,7 +746,7 @@ def copy(ctx, source: str, destination: str, recursive: bool, force: bool):
     try:
         if source_path.is_file():
             console.print(f"[cyan]📋 Copying file: {source} → {destination}[/cyan]")
-            shutil.copy2(source_path, dest_path)
+            file_manager.copy_file(source_path, dest_path)
         elif source_path.is_dir() and recursive:
             console.print(f"[cyan]📋 Copying directory: {source} → {destination}[/cyan]")
             if dest_path.exists():
@@ -335,6 +767,8 @@ def copy(ctx, source: str, destination: str, recursive: bool, force: bool):
 @click.pass_context
 def move(ctx, source: str, destination: str):
     """🔄 Move/rename files or directories"""
+    from rich.prompt import Confirm
+    
     source_path = Path(source)
     dest_path = Path(destination)
     
@@ -362,6 +796,8 @@ def move(ctx, source: str, destination: str):
 @click.pass_context
 def delete(ctx, paths: tuple, recursive: bool, force: bool):
     """🗑️ Delete files or directories"""
+    from rich.prompt import Confirm
+    
     if not paths:
         console.print("[red]Error: No paths specified[/red]")
         return
@@ -399,6 +835,10 @@ def delete(ctx, paths: tuple, recursive: bool, force: bool):
 @click.pass_context
 def archive(ctx, archive_path: str, files: tuple, format: str):
     """📦 Create archives from files/directories"""
+    import tarfile
+    
+    zipfile = _import_zipfile()
+    file_manager = ctx.obj['file_manager']
     if not files:
         console.print("[red]Error: No files specified[/red]")
         return
@@ -409,23 +849,40 @@ def archive(ctx, archive_path: str, files: tuple, format: str):
     
     try:
         if format == 'zip':
+            # Collect every member first so they can be compressed in parallel
+            members = []
+            for file_path in files:
+                path = Path(file_path)
+                if path.exists():
+                    if path.is_file():
+                        members.append((path, path.name))
+                    elif path.is_dir():
+                        for file in path.rglob('*'):
+                            if file.is_file():
+                                members.append((file, str(file.relative_to(path.parent))))
+                    console.print(f"[green]  ✅ Added: {file_path}[/green]")
+                else:
+                    console.print(f"[yellow]  ⚠️  Skipped: {file_path} (not found)[/yellow]")
+            
             with zipfile.ZipFile(archive_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for file_path in files:
-                    path = Path(file_path)
-                    if path.exists():
-                        if path.is_file():
-                            zf.write(path, path.name)
-                        elif path.is_dir():
-                            for file in path.rglob('*'):
-                                if file.is_file():
-                                    zf.write(file, file.relative_to(path.parent))
-                        console.print(f"[green]  ✅ Added: {file_path}[/green]")
-                    else:
-                        console.print(f"[yellow]  ⚠️  Skipped: {file_path} (not found)[/yellow]")
+                file_manager.write_zip_members(zf, members)
         
         elif format in ['tar', 'tar.gz']:
-            mode = 'w:gz' if format == 'tar.gz' else 'w'
-            with tarfile.open(archive_file, mode) as tf:
+            try:
+                from zlib_ng import gzip_ng_threaded
+            except ImportError:
+                gzip_ng_threaded = None
+            
+            if format == 'tar.gz' and gzip_ng_threaded is not None:
+                # Compress on multiple threads; same level as tarfile's 'w:gz'
+                gz = gzip_ng_threaded.open(archive_file, 'wb', compresslevel=9,
+                                           threads=os.cpu_count() or 1)
+                tf = tarfile.open(fileobj=gz, mode='w|')
+            else:
+                gz = None
+                tf = tarfile.open(archive_file, 'w:gz' if format == 'tar.gz' else 'w')
+            
+            try:
                 for file_path in files:
                     path = Path(file_path)
                     if path.exists():
@@ -433,6 +890,10 @@ def archive(ctx, archive_path: str, files: tuple, format: str):
                         console.print(f"[green]  ✅ Added: {file_path}[/green]")
                     else:
                         console.print(f"[yellow]  ⚠️  Skipped: {file_path} (not found)[/yellow]")
+            finally:
+                tf.close()
+                if gz is not None:
+                    gz.close()
         
         console.print(f"[green]✅ Archive created: {archive_path}[/green]")
         
@@ -445,6 +906,9 @@ def archive(ctx, archive_path: str, files: tuple, format: str):
 @click.pass_context
 def extract(ctx, archive_path: str, destination: str):
     """📂 Extract archives"""
+    import tarfile
+    
+    zipfile = _import_zipfile()
     archive_file = Path(archive_path)
     dest_dir = Path(destination)
     
@@ -454,13 +918,46 @@ def extract(ctx, archive_path: str, destination: str):
     
     console.print(f"[cyan]📂 Extracting: {archive_path} → {destination}[/cyan]")
     
+    # Extracted data is rarely read back right away, so written files'
+    # pages are released instead of crowding the page cache
+    file_manager = ctx.obj['file_manager']
+    
     try:
         if archive_path.endswith('.zip'):
             with zipfile.ZipFile(archive_file, 'r') as zf:
-                zf.extractall(dest_dir)
+                for member in zf.infolist():
+                    target = zf.extract(member, dest_dir)
+                    if not member.is_dir():
+                        file_manager.release_file_cache(target)
         elif archive_path.endswith(('.tar', '.tar.gz', '.tgz')):
-            with tarfile.open(archive_file, 'r:*') as tf:
-                tf.extractall(dest_dir)
+            with tarfile.open(archive_file, 'r:*', copybufsize=COPY_BUFFER_SIZE) as tf:
+                if hasattr(tarfile, 'fully_trusted_filter'):
+                    # Wrap the filter extractall would apply anyway, which
+                    # reports the path each member is really written to
+                    default_filter = tf.extraction_filter or (
+                        tarfile.data_filter if sys.version_info >= (3, 14)
+                        else tarfile.fully_trusted_filter)
+                    written = []
+                    
+                    def release_and_filter(member, dest_path):
+                        # Members are filtered one at a time right before they
+                        # are extracted, so the previous file is complete
+                        while written:
+                            file_manager.release_file_cache(written.pop())
+                        member = default_filter(member, dest_path)
+                        if member is not None and member.isreg():
+                            written.append(os.path.join(dest_path, member.name))
+                        return member
+                    
+                    tf.extractall(dest_dir, filter=release_and_filter)
+                    while written:
+                        file_manager.release_file_cache(written.pop())
+                else:
+                    # No extraction filters: members land at their own names
+                    tf.extractall(dest_dir)
+                    for member in tf.getmembers():
+                        if member.isreg():
+                            file_manager.release_file_cache(os.path.join(dest_dir, member.name))
         else:
             console.print("[red]Error: Unsupported archive format[/red]")
             return
@@ -474,9 +971,14 @@ def extract(ctx, archive_path: str, destination: str):
 @click.argument('file_path')
 @click.option('--lines', '-n', default=10, help='Number of lines to display')
 @click.option('--syntax', '-s', help='Syntax highlighting language')
+@click.option('--count', '-c', is_flag=True, help='Count total lines when output is truncated')
 @click.pass_context
-def view(ctx, file_path: str, lines: int, syntax: Optional[str]):
+def view(ctx, file_path: str, lines: int, syntax: Optional[str], count: bool):
     """👁️ View file contents with syntax highlighting"""
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+    
+    file_manager = ctx.obj['file_manager']
     file = Path(file_path)
     
     if not file.exists():
@@ -488,8 +990,15 @@ def view(ctx, file_path: str, lines: int, syntax: Optional[str]):
         return
     
     try:
+        # Only read as many lines as will be shown
         with open(file, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
+            head = [*islice(f, max(lines, 0))]
+            # Peek one character; next(f) would decode a whole (maybe huge) line
+            truncated = f.read(1) != ''
+        
+        content = ''.join(head)
+        if content.endswith('\n'):
+            content = content[:-1]
         
         # Auto-detect syntax if not specified
         if not syntax:
@@ -502,15 +1011,6 @@ def view(ctx, file_path: str, lines: int, syntax: Optional[str]):
             }
             syntax = syntax_map.get(suffix, 'text')
         
-        # Truncate if too many lines
-        lines_in_content = content.count('\n') + 1
-        if lines < lines_in_content:
-            content_lines = content.split('\n')
-            content = '\n'.join(content_lines[:lines])
-            truncated = True
-        else:
-            truncated = False
-        
         syntax_obj = Syntax(content, syntax, theme="monokai", line_numbers=True)
         
         panel = Panel(
@@ -521,17 +1021,24 @@ def view(ctx, file_path: str, lines: int, syntax: Optional[str]):
         
         console.print(panel)
         
-        if truncated:
-            console.print(f"[dim]... showing first {lines} of {lines_in_content} lines[/dim]")
+        if truncated and count:
+            total_lines = file_manager.count_lines(file)
+            console.print(f"[dim]... showing first {lines} of {total_lines:,} lines[/dim]")
+        elif truncated:
+            console.print(f"[dim]... showing first {lines} lines (use --count for the total)[/dim]")
     
     except Exception as e:
         console.print(f"[red]Error reading file: {e}[/red]")
 
 @cli.command()
 @click.option('--path', '-p', default='.', help='Directory to analyze')
+@click.option('--no-hidden', is_flag=True, help='Skip hidden files and directories')
 @click.pass_context
-def analyze(ctx, path: str):
+def analyze(ctx, path: str, no_hidden: bool):
     """📊 Analyze directory statistics"""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+    
     file_manager = ctx.obj['file_manager']
     target_path = Path(path).resolve()
     
@@ -545,8 +1052,8 @@ def analyze(ctx, path: str):
     total_files = 0
     total_dirs = 0
     total_size = 0
-    file_types = {}
-    largest_files = []
+    file_types = Counter()
+    largest_files = []  # (size, path) of the biggest files seen so far
     
     with Progress(
         SpinnerColumn(),
@@ -555,29 +1062,19 @@ def analyze(ctx, path: str):
     ) as progress:
         task = progress.add_task("Scanning files...", total=None)
         
-        for item in target_path.rglob('*'):
-            try:
-                if item.is_file():
-                    total_files += 1
-                    size = item.stat().st_size
-                    total_size += size
-                    
-                    # Track file types
-                    ext = item.suffix.lower() or 'no extension'
-                    file_types[ext] = file_types.get(ext, 0) + 1
-                    
-                    # Track largest files
-                    largest_files.append((item, size))
-                    
-                elif item.is_dir():
-                    total_dirs += 1
-                    
-            except (PermissionError, OSError):
-                continue
-    
-    # Sort and limit largest files
-    largest_files.sort(key=lambda x: x[1], reverse=True)
-    largest_files = largest_files[:10]
+        for dirs, file_paths, file_sizes in file_manager.scan_tree(target_path, not no_hidden):
+            total_dirs += len(dirs)
+            total_files += len(file_paths)
+            total_size += sum(file_sizes)
+            
+            # Track file types
+            file_types.update(_file_suffix(os.path.basename(file_path)) or 'no extension'
+                              for file_path in file_paths)
+            
+            # Track largest files
+            if file_paths:
+                largest_files = heapq.nlargest(LARGEST_FILES_LIMIT,
+                                               chain(largest_files, zip(file_sizes, file_paths)))
     
     # Create summary table
     summary_table = Table(title="📊 Directory Analysis Summary", show_header=True)
@@ -613,8 +1110,8 @@ def analyze(ctx, path: str):
         large_table.add_column("File", style="cyan")
         large_table.add_column("Size", style="green", justify="right")
         
-        for file_path, size in largest_files:
-            relative_path = file_path.relative_to(target_path)
+        for size, file_path in largest_files:
+            relative_path = os.path.relpath(file_path, target_path)
             large_table.add_row(str(relative_path), file_manager.format_size(size))
         
         console.print(large_table)
@@ -15,6 +15,9 @@ setup(
         "click>=8.0.0",
         "rich>=13.0.0",
     ],
+    extras_require={
+        "fast": ["zlib-ng>=0.4.0"],
+    },
     entry_points={
         "console_scripts": [
             "fm=filemanager:cli",